@@ -0,0 +1,58 @@
+import json
+import logging
+from os.path import join
+from pathlib import Path
+
+from config import DATA_DIR
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+_HEADER = '"""Chapter names frozen by gen_chapters.py - regenerate, do not edit."""'
+
+
+def generate_chapters_module(input_file_path: str, output_file_path: str) -> None:
+    """
+    Freezes the chapter names JSON into a Python module literal.
+
+    The names are static data, so importing the generated module (served
+    from the marshaled .pyc cache) is far faster than parsing JSON on
+    every build run.
+
+    Args:
+        input_file_path: The path to the chapter names JSON file.
+        output_file_path: The path to the generated Python module.
+    """
+    input_path = Path(input_file_path)
+    output_path = Path(output_file_path)
+
+    try:
+        with open(input_path, encoding="utf-8") as f:
+            chapter_names = json.load(f)
+    except (json.JSONDecodeError, FileNotFoundError) as e:
+        logger.error(f"Error loading chapter names from {input_path}: {e}")
+        return
+
+    # Accept both the current [chapter_id, name] pairs and the legacy
+    # dict keyed by stringified chapter numbers
+    if isinstance(chapter_names, dict):
+        pairs = sorted((int(num), name) for num, name in chapter_names.items())
+    else:
+        pairs = [tuple(pair) for pair in chapter_names]
+
+    lines = [_HEADER, "", "CHAPTER_NAMES = ("]
+    for chapter_id, name in pairs:
+        lines.append(f"    ({chapter_id}, {name!r}),")
+    lines.append(")")
+
+    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    logger.info(f"Generated {output_path} with {len(pairs)} chapter names")
+
+
+if __name__ == "__main__":
+    input_file = join(DATA_DIR, "quran_chapters_names.json")
+    generate_chapters_module(input_file, "chapters_names_data.py")
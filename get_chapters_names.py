@@ -1,12 +1,19 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import requests
 from os.path import join
 
 from config import QURAN_INFO, INDENT_SIZE, DATA_DIR
 
+# orjson parses large JSON files several times faster than stdlib json;
+# fall back to stdlib if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,12 +43,13 @@ def get_quran_chapters_names(input_file_path: str, output_file_path: str) -> Non
         return
 
     try:
-        # Extract chapter names
+        # Extract chapter names as [chapter_id, name] pairs; JSON dict keys
+        # would be coerced to strings and need int() casts on every load
         chapters = quran_data.get("chapters", [])
-        chapter_names: Dict[int, str] = {
-            chapter["chapter"]: chapter["arabicname"] for chapter in chapters
-        }
-        
+        chapter_names: List[List] = [
+            [chapter["chapter"], chapter["arabicname"]] for chapter in chapters
+        ]
+
         # Save to output file
         with open(output_path, "w", encoding="utf-8") as o:
             json.dump(chapter_names, o, ensure_ascii=False, indent=INDENT_SIZE)
@@ -58,6 +66,8 @@ def _get_quran_data(input_path: Path) -> Optional[Dict]:
     """Gets Quran data from file or downloads it if file doesn't exist"""
     if input_path.exists():
         try:
+            if orjson is not None:
+                return orjson.loads(input_path.read_bytes())
             with open(input_path, encoding="utf-8") as f:
                 return json.load(f)
         except json.JSONDecodeError:
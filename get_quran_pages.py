@@ -12,45 +12,83 @@ import aiohttp
 
 from config import DATA_DIR, INDENT_SIZE, QURAN_EDITIONS, QURAN_PAGES, DEFAULT_BATCH_SIZE, DEFAULT_MAX_CONCURRENT
 
+# orjson parses large JSON files several times faster than stdlib json;
+# fall back to stdlib if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack makes the combined file ~3x smaller and much faster to reparse;
+# fall back to JSON output if it is not installed
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Shared pool for file writes; spinning up a new executor per page write
+# costs more than the write itself
+_WRITE_POOL = ThreadPoolExecutor(max_workers=4)
+
 
 @dataclass
 class DownloadResult:
+    # data is the page object itself when packing to msgpack, otherwise a
+    # serialized JSON fragment ready for concatenation
     page_num: int
-    data: Optional[Dict[str, Any]]
+    data: Optional[Any]
 
 
 class QuranDownloader:
-    def __init__(self, quran_edition: str, start_page: int = 1, end_page: int = 604, 
-                 batch_size: int = DEFAULT_BATCH_SIZE, max_concurrent: int = DEFAULT_MAX_CONCURRENT):
+    def __init__(self, quran_edition: str, start_page: int = 1, end_page: int = 604,
+                 batch_size: int = DEFAULT_BATCH_SIZE, max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+                 keep_pages: bool = False):
         self.start_page = start_page
         self.end_page = end_page
         self.quran_edition = quran_edition
         self.edition_dir = Path(join(DATA_DIR, quran_edition))
-        self.complete_file = self.edition_dir / f"{quran_edition}.json"
+        complete_suffix = "msgpack" if msgpack is not None else "json"
+        self.complete_file = self.edition_dir / f"{quran_edition}.{complete_suffix}"
         self.batch_size = batch_size
         self.base_url = QURAN_PAGES.format(quran_edition, "{}")
-        self.semaphore = asyncio.Semaphore(max_concurrent)
-        
+        self.max_concurrent = max_concurrent
+        self.keep_pages = keep_pages
+
     async def download_page(self, session: aiohttp.ClientSession, page_num: int) -> DownloadResult:
         """Download a single page asynchronously"""
         url = self.base_url.format(page_num)
         output_file = self.edition_dir / f"page_{page_num}.json"
 
         try:
-            async with self.semaphore:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        page_object = {
-                            f"page_{page_num}": data["pages"]
-                        }
-                        
+            async with session.get(url) as response:
+                if response.status == 200:
+                    raw = await response.read()
+                    if orjson is not None:
+                        pages = orjson.loads(raw)["pages"]
+                    else:
+                        pages = json.loads(raw)["pages"]
+
+                    # [page_num, verses] wrapper: the DB builder reads the
+                    # page number directly instead of parsing "page_<n>" keys
+                    page_object = [page_num, pages]
+
+                    if self.keep_pages:
                         await self._save_json_async(output_file, page_object)
+
+                    if msgpack is not None:
+                        # Packed in one go at the end of the download
                         return DownloadResult(page_num, page_object)
+
+                    # Serialize once; the combined file is assembled by
+                    # concatenating these fragments without re-parsing
+                    if orjson is not None:
+                        fragment = orjson.dumps(page_object)
                     else:
-                        print(f"Error downloading page {page_num}: Status {response.status}")
-                        return DownloadResult(page_num, None)
+                        fragment = json.dumps(page_object, ensure_ascii=False).encode('utf-8')
+                    return DownloadResult(page_num, fragment)
+                else:
+                    print(f"Error downloading page {page_num}: Status {response.status}")
+                    return DownloadResult(page_num, None)
 
         except Exception as e:
             print(f"Error processing page {page_num}: {str(e)}")
@@ -59,52 +97,71 @@ class QuranDownloader:
     async def _save_json_async(self, filename: Path, data: Dict) -> None:
         """Save JSON data to file asynchronously"""
         def _write_json():
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=INDENT_SIZE)
-                
-        with ThreadPoolExecutor() as pool:
-            await asyncio.get_event_loop().run_in_executor(pool, _write_json)
+            if orjson is not None:
+                filename.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=INDENT_SIZE)
+
+        await asyncio.get_event_loop().run_in_executor(_WRITE_POOL, _write_json)
 
-    async def process_batch(self, session: aiohttp.ClientSession, batch_pages: range) -> List[Dict]:
-        """Process a batch of pages concurrently"""
-        tasks = [self.download_page(session, page_num) for page_num in batch_pages]
-        results = await asyncio.gather(*tasks)
-        return [result.data for result in results if result.data is not None]
+    async def _save_bytes_async(self, filename: Path, payload: bytes) -> None:
+        """Write pre-serialized bytes to file asynchronously"""
+        await asyncio.get_event_loop().run_in_executor(_WRITE_POOL, filename.write_bytes, payload)
 
     async def download_all(self) -> None:
-        """Download all pages in batches"""
+        """Download all pages, streaming results as they complete"""
         # Create directory if it doesn't exist
         self.edition_dir.mkdir(exist_ok=True)
 
-        async with aiohttp.ClientSession() as session:
+        # A bounded keep-alive pool reuses TCP/TLS connections across all
+        # 604 requests and throttles concurrency at the connector level,
+        # replacing the separate semaphore
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
             start_time = time.time()
-            all_pages = []
-            
-            # Process pages in batches
-            for batch_start in range(self.start_page, self.end_page + 1, self.batch_size):
-                batch_end = min(batch_start + self.batch_size, self.end_page + 1)
-                batch_pages = range(batch_start, batch_end)
-                
-                print(f"Processing pages {batch_start} to {batch_end-1}...")
-                batch_results = await self.process_batch(session, batch_pages)
-                all_pages.extend(batch_results)
-                
-                # Show progress
-                pages_processed = len(all_pages)
-                elapsed_time = time.time() - start_time
-                pages_per_second = pages_processed / elapsed_time if elapsed_time > 0 else 0
-                print(f"Processed {pages_processed} pages. "
-                      f"Speed: {pages_per_second:.2f} pages/second")
-
-            # Create and save the final combined file
-            complete_quran = {"pages": all_pages}
-            await self._save_json_async(self.complete_file, complete_quran)
+            results: List[DownloadResult] = []
+
+            # All requests are issued up front; the connector limit throttles
+            # them, and as_completed streams results back as they finish
+            # instead of stalling at a barrier after every batch
+            tasks = [self.download_page(session, page_num)
+                     for page_num in range(self.start_page, self.end_page + 1)]
+
+            for future in asyncio.as_completed(tasks):
+                result = await future
+                if result.data is not None:
+                    results.append(result)
+
+                # Show progress once per batch_size completions
+                pages_processed = len(results)
+                if pages_processed % self.batch_size == 0:
+                    elapsed_time = time.time() - start_time
+                    pages_per_second = pages_processed / elapsed_time if elapsed_time > 0 else 0
+                    print(f"Processed {pages_processed} pages. "
+                          f"Speed: {pages_per_second:.2f} pages/second")
+
+            # Completion order is arbitrary; the combined file keeps
+            # canonical page order
+            results.sort(key=lambda result: result.page_num)
+            all_pages = [result.data for result in results]
+
+            if msgpack is not None:
+                # Binary combined file: smaller on disk and parsed by the
+                # DB builder without any JSON decode
+                complete_quran = msgpack.packb({"pages": all_pages})
+            else:
+                # Assemble the combined file from the serialized fragments -
+                # no re-parse or re-serialize of the full multi-MB structure
+                complete_quran = b'{"pages":[' + b','.join(all_pages) + b']}'
+            await self._save_bytes_async(self.complete_file, complete_quran)
 
             total_time = time.time() - start_time
             print(f"\nDownload complete!")
             print(f"Total time: {total_time:.2f} seconds")
             print(f"Average speed: {len(all_pages)/total_time:.2f} pages/second")
-            print(f"Individual pages saved in: {self.edition_dir}")
+            if self.keep_pages:
+                print(f"Individual pages saved in: {self.edition_dir}")
             print(f"Combined Quran saved as: {self.complete_file}")
             print(f"Total pages processed: {len(all_pages)}")
 
@@ -138,14 +195,16 @@ async def main() -> None:
     parser.add_argument("-e", "--edition", type=str, help="Specify edition directly instead of selection menu")
     parser.add_argument("-b", "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Batch size for downloads")
     parser.add_argument( "-m", "--max-concurrent", type=int, default=DEFAULT_MAX_CONCURRENT, help="Maximum concurrent connections")
+    parser.add_argument("-k", "--keep-pages", action="store_true", help="Also save each page as an individual JSON file")
     args = parser.parse_args()
-    
+
     edition = args.edition if args.edition else get_user_selection()
-    
+
     downloader = QuranDownloader(
         quran_edition=edition,
         batch_size=args.batch_size,
-        max_concurrent=args.max_concurrent
+        max_concurrent=args.max_concurrent,
+        keep_pages=args.keep_pages
     )
     
     await downloader.download_all()